@@ -9,10 +9,14 @@ bl_info = {
 }
 
 import bpy
+from bpy.props import PointerProperty
+from .properties import DEPTHMESH_PG_settings
 from .operators import DEPTHMESH_OT_generate, DEPTHMESH_OT_install_ai, DEPTHMESH_OT_generate_ai, DEPTHMESH_OT_download_model
 from .ui import DEPTHMESH_PT_panel
 
 def register():
+    bpy.utils.register_class(DEPTHMESH_PG_settings)
+    bpy.types.Object.depth_mesh = PointerProperty(type=DEPTHMESH_PG_settings)
     bpy.utils.register_class(DEPTHMESH_OT_install_ai)
     bpy.utils.register_class(DEPTHMESH_OT_download_model)
     bpy.utils.register_class(DEPTHMESH_OT_generate_ai)
@@ -25,6 +29,8 @@ def unregister():
     bpy.utils.unregister_class(DEPTHMESH_OT_generate_ai)
     bpy.utils.unregister_class(DEPTHMESH_OT_download_model)
     bpy.utils.unregister_class(DEPTHMESH_OT_install_ai)
+    del bpy.types.Object.depth_mesh
+    bpy.utils.unregister_class(DEPTHMESH_PG_settings)
 
 if __name__ == "__main__":
     register()
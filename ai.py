@@ -143,6 +143,23 @@ def start_download_thread():
     thread.start()
 
 # Inference
+def _load_input_image(image_path, target_size):
+    """
+    Decode image_path only as large as needed to feed the model.
+    Returns (image, original_size). The original size is read from the header,
+    so the full-resolution pixels are never decoded.
+    """
+    from PIL import Image
+
+    image = Image.open(image_path)
+    orig_size = image.size
+    
+    # JPEG can decode at 1/2, 1/4 or 1/8 scale in the DCT domain.
+    # draft() picks the smallest scale that is still >= target_size,
+    # and is a no-op for other formats.
+    image.draft('RGB', target_size)
+    return image.convert('RGB'), orig_size
+
 def process_image(image_path):
     """
     Run depth estimation on the image at image_path.
@@ -186,10 +203,10 @@ def process_image(image_path):
             log.write(f"Processing image with target size: {target_size}\n")
             
             # Load and Preprocess Image
-            orig_image = Image.open(image_path).convert('RGB')
-            orig_width, orig_height = orig_image.size
+            input_image, (orig_width, orig_height) = _load_input_image(image_path, target_size)
+            log.write(f"Original size: {orig_width}x{orig_height}, decoded at: {input_image.size}\n")
             
-            input_image = orig_image.resize(target_size, Image.BILINEAR)
+            input_image = input_image.resize(target_size, Image.BILINEAR)
             input_tensor = np.array(input_image) / 255.0 # 0-1
             
             # Normalize (Mean and Std for ImageNet)
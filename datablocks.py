@@ -0,0 +1,96 @@
+import os
+import bpy
+
+# Custom property keys used to tag the datablocks this add-on creates.
+# Stored on the ID itself (not in a Python dict) so they survive undo and file save/load.
+PROP_FILEPATH = "depthmesh_filepath"
+PROP_MTIME = "depthmesh_mtime"
+PROP_EXTENSION = "depthmesh_extension"
+
+def _normalize(filepath):
+    return os.path.normcase(os.path.abspath(bpy.path.abspath(filepath)))
+
+def get_image(filepath):
+    """
+    Return an image datablock for filepath, reusing an existing one when possible.
+    Images are keyed by absolute path and modification time: if the file changed on
+    disk since it was loaded, the existing datablock is reloaded in place.
+    """
+    path = _normalize(filepath)
+    mtime = os.path.getmtime(path)
+
+    for img in bpy.data.images:
+        if img.get(PROP_FILEPATH) != path:
+            continue
+        if img.get(PROP_MTIME) != mtime:
+            img.reload()
+            img[PROP_MTIME] = mtime
+        return img
+
+    img = bpy.data.images.load(path)
+    img[PROP_FILEPATH] = path
+    img[PROP_MTIME] = mtime
+    return img
+
+def get_texture(img, extension):
+    """Return an image texture for img with the given extension mode, reusing an existing one."""
+    for tex in bpy.data.textures:
+        if tex.type == 'IMAGE' and tex.image == img and tex.get(PROP_EXTENSION) == extension:
+            return tex
+
+    tex = bpy.data.textures.new("DepthTexture", type="IMAGE")
+    tex.image = img
+    tex.extension = extension
+    tex[PROP_EXTENSION] = extension
+    return tex
+
+def get_material(img):
+    """Return a Principled BSDF material using img as Base Color, reusing an existing one."""
+    for mat in bpy.data.materials:
+        if mat.get(PROP_FILEPATH) != img.get(PROP_FILEPATH) or not mat.use_nodes:
+            continue
+        for node in mat.node_tree.nodes:
+            if node.type == 'TEX_IMAGE' and node.image == img:
+                return mat
+
+    mat = bpy.data.materials.new(name="DepthMaterial")
+    mat[PROP_FILEPATH] = img.get(PROP_FILEPATH)
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+
+    # Clear default nodes to ensure clean state
+    nodes.clear()
+
+    # Create Principled BSDF
+    shader = nodes.new(type='ShaderNodeBsdfPrincipled')
+    shader.location = (0, 0)
+
+    # Create Output
+    output = nodes.new(type='ShaderNodeOutputMaterial')
+    output.location = (300, 0)
+
+    # Create Image Texture
+    tex_node = nodes.new(type='ShaderNodeTexImage')
+    tex_node.location = (-300, 0)
+    tex_node.image = img
+
+    # Link
+    links.new(tex_node.outputs['Color'], shader.inputs['Base Color'])
+    links.new(shader.outputs['BSDF'], output.inputs['Surface'])
+    return mat
+
+def purge_orphans():
+    """
+    Remove datablocks created by this add-on that no longer have any users.
+    Materials go first, then textures, then images, since each holds a user on the next.
+    Returns the number of datablocks removed.
+    """
+    removed = 0
+    for collection in (bpy.data.materials, bpy.data.textures, bpy.data.images):
+        for block in list(collection):
+            is_ours = PROP_FILEPATH in block or PROP_EXTENSION in block
+            if is_ours and block.users == 0:
+                collection.remove(block)
+                removed += 1
+    return removed
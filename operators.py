@@ -3,6 +3,8 @@ import os
 from bpy.types import Operator
 from bpy.props import StringProperty, FloatProperty, BoolProperty, EnumProperty
 from . import ai
+from . import datablocks
+from . import properties
 
 class DEPTHMESH_OT_install_ai(Operator):
     bl_idname = "object.install_ai_dependencies"
@@ -115,29 +117,14 @@ class DEPTHMESH_OT_generate_ai(Operator):
             
         self.report({'INFO'}, f"Depth map saved to {depth_path}")
         
-        # 3. Call the Mesh Generator
+        # 3. Call the Mesh Generator, colored by the original image
         bpy.ops.object.generate_depth_mesh(
             filepath=depth_path, 
+            color_filepath=filepath,
             use_color_map=True, 
             use_alpha_mask=False,
             depth_strength=1.0
         )
-        
-        # Fix texture
-        active_obj = context.active_object
-        if active_obj and active_obj.name.startswith("DepthMesh"):
-            if active_obj.data.materials:
-                mat = active_obj.data.materials[0]
-                if mat.use_nodes:
-                    nodes = mat.node_tree.nodes
-                    for node in nodes:
-                        if node.type == 'TEX_IMAGE':
-                            try:
-                                orig_img = bpy.data.images.load(filepath)
-                                node.image = orig_img
-                            except:
-                                pass
-                            break
 
         return {'FINISHED'}
 
@@ -161,6 +148,13 @@ class DEPTHMESH_OT_generate(Operator):
         maxlen=255,
     )
 
+    color_filepath: StringProperty(
+        name="Color Image",
+        description="Image used for the color material (defaults to the depth map)",
+        subtype="FILE_PATH",
+        options={'HIDDEN'},
+    )
+
     use_color_map: BoolProperty(
         name="Use as Color",
         description="Apply the image as a Base Color material to the mesh",
@@ -253,6 +247,13 @@ class DEPTHMESH_OT_generate(Operator):
         max=10.0
     )
 
+    # 4. Memory
+    purge_orphans: BoolProperty(
+        name="Purge Unused Data",
+        description="Remove images, textures and materials from earlier generations that are no longer used",
+        default=True
+    )
+
     def execute(self, context):
         if not self.filepath:
             self.report({"ERROR"}, "No image path provided")
@@ -265,9 +266,9 @@ class DEPTHMESH_OT_generate(Operator):
              self.report({"ERROR"}, f"File not found: {filepath}")
              return {"CANCELLED"}
 
-        # Load image
+        # Load image (reused if already loaded and unchanged on disk)
         try:
-            img = bpy.data.images.load(filepath)
+            img = datablocks.get_image(filepath)
         except Exception as e:
             self.report({"ERROR"}, f"Failed to load image: {str(e)}")
             return {"CANCELLED"}
@@ -278,12 +279,7 @@ class DEPTHMESH_OT_generate(Operator):
         plane.name = "DepthMesh"
 
         # Create Texture
-        tex = bpy.data.textures.new("DepthTexture", type="IMAGE")
-        tex.image = img
-        if self.use_clamp:
-            tex.extension = 'CLIP'
-        else:
-            tex.extension = 'EXTEND'
+        tex = datablocks.get_texture(img, 'CLIP' if self.use_clamp else 'EXTEND')
 
         # 1. Silhouette Masking Logic
         # We create a Vertex Group and use a VertexWeightEdit modifier masked by texture to control it.
@@ -346,56 +342,25 @@ class DEPTHMESH_OT_generate(Operator):
         if displace_vg_name:
             disp.vertex_group = displace_vg_name
 
-        # 2. Geometry Refinement
-        if self.refinement_method == 'REMESH':
-            remesh = plane.modifiers.new("Remesh", "REMESH")
-            remesh.mode = 'VOXEL'
-            remesh.voxel_size = self.remesh_voxel_size
-            remesh.adaptivity = 0.0
-            remesh.use_smooth_shade = True
-
-        # Optimization / Decimation
-        if self.use_optimization:
-            decimate = plane.modifiers.new("Optimize", "DECIMATE")
-            decimate.decimate_type = 'COLLAPSE'
-            decimate.ratio = self.optimization_ratio
-            # If using Voxel Remesh, usually Triangulate is handled by it, but Decimate works on Tris.
-            # No special extra settings needed for basic reduction.
-
-        # 3. Volume / Solidity
-        if self.use_solidify:
-            solid = plane.modifiers.new("Solidify", "SOLIDIFY")
-            solid.thickness = self.thickness_amount
-            solid.offset = 0 # Center the solidify? Or -1. User usually expects inward/outward. Default -1.
-            # To prevent "collapsing edges" (z-fighting/self intersection), we might want Even Thickness
-            solid.use_even_offset = True
+        # 2. Geometry Refinement and 3. Volume / Solidity
+        # Store the parameters on the object so they can be tweaked in place later
+        # (see properties.py) without regenerating the mesh.
+        settings = plane.depth_mesh
+        for key in properties.SETTINGS_KEYS:
+            setattr(settings, key, getattr(self, key))
+        settings.is_depth_mesh = True
+        properties.sync_modifiers(plane)
 
         # 4. Material / Color
         if self.use_color_map:
-            mat = bpy.data.materials.new(name="DepthMaterial")
-            mat.use_nodes = True
-            nodes = mat.node_tree.nodes
-            links = mat.node_tree.links
-            
-            # Clear default nodes to ensure clean state
-            nodes.clear()
-            
-            # Create Principled BSDF
-            shader = nodes.new(type='ShaderNodeBsdfPrincipled')
-            shader.location = (0, 0)
-            
-            # Create Output
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            output.location = (300, 0)
-            
-            # Create Image Texture
-            tex_node = nodes.new(type='ShaderNodeTexImage')
-            tex_node.location = (-300, 0)
-            tex_node.image = img
-            
-            # Link
-            links.new(tex_node.outputs['Color'], shader.inputs['Base Color'])
-            links.new(shader.outputs['BSDF'], output.inputs['Surface'])
+            color_img = img
+            if self.color_filepath:
+                try:
+                    color_img = datablocks.get_image(self.color_filepath)
+                except Exception as e:
+                    self.report({"WARNING"}, f"Failed to load color image, using depth map: {str(e)}")
+
+            mat = datablocks.get_material(color_img)
             
             # Assign to plane
             if plane.data.materials:
@@ -406,6 +371,9 @@ class DEPTHMESH_OT_generate(Operator):
             # Set viewport display to textured to see it immediately
             context.space_data.shading.type = 'MATERIAL'
 
+        if self.purge_orphans:
+            datablocks.purge_orphans()
+
         return {"FINISHED"}
 
     def invoke(self, context, event):
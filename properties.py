@@ -0,0 +1,199 @@
+from bpy.types import PropertyGroup
+from bpy.props import FloatProperty, BoolProperty, EnumProperty
+from . import datablocks
+
+# Optional modifiers, in stack order, after Subdivision and Displace.
+OPTIONAL_MODIFIERS = ("Remesh", "Optimize", "Solidify")
+
+# Generation parameters shared with DEPTHMESH_OT_generate and copied onto the object.
+SETTINGS_KEYS = (
+    "depth_strength", "depth_midlevel", "invert_depth", "use_clamp",
+    "refinement_method", "use_optimization", "optimization_ratio",
+    "remesh_voxel_size", "use_solidify", "thickness_amount",
+)
+
+# Update callbacks
+# Each one only touches the modifier the edited value affects, so dragging a slider
+# in the sidebar updates the existing object instead of rebuilding it.
+def _update_displace(self, context):
+    if not self.is_depth_mesh:
+        return
+    disp = self.id_data.modifiers.get("Displace")
+    if disp is None:
+        return
+    disp.strength = -self.depth_strength if self.invert_depth else self.depth_strength
+    disp.mid_level = self.depth_midlevel
+
+def _update_clamp(self, context):
+    if not self.is_depth_mesh:
+        return
+    obj = self.id_data
+    disp = obj.modifiers.get("Displace")
+    if disp is None or disp.texture is None:
+        return
+    # Swap to the cached texture for this extension mode rather than editing
+    # the shared one, which other depth meshes may still use.
+    tex = datablocks.get_texture(disp.texture.image, 'CLIP' if self.use_clamp else 'EXTEND')
+    disp.texture = tex
+    vw_mod = obj.modifiers.get("MaskWeights")
+    if vw_mod is not None:
+        vw_mod.mask_texture = tex
+
+def _update_remesh(self, context):
+    if not self.is_depth_mesh:
+        return
+    remesh = self.id_data.modifiers.get("Remesh")
+    if remesh is not None:
+        remesh.voxel_size = self.remesh_voxel_size
+
+def _update_optimize(self, context):
+    if not self.is_depth_mesh:
+        return
+    decimate = self.id_data.modifiers.get("Optimize")
+    if decimate is not None:
+        decimate.ratio = self.optimization_ratio
+
+def _update_solidify(self, context):
+    if not self.is_depth_mesh:
+        return
+    solid = self.id_data.modifiers.get("Solidify")
+    if solid is not None:
+        solid.thickness = self.thickness_amount
+
+def _update_stack(self, context):
+    if not self.is_depth_mesh:
+        return
+    sync_modifiers(self.id_data)
+
+def sync_modifiers(obj):
+    """
+    Add or remove the optional modifiers of a depth mesh to match its settings.
+    They are rebuilt together to keep their order; Subdivision and Displace are left untouched.
+    """
+    settings = obj.depth_mesh
+    for name in OPTIONAL_MODIFIERS:
+        mod = obj.modifiers.get(name)
+        if mod is not None:
+            obj.modifiers.remove(mod)
+
+    # Geometry Refinement
+    if settings.refinement_method == 'REMESH':
+        remesh = obj.modifiers.new("Remesh", "REMESH")
+        remesh.mode = 'VOXEL'
+        remesh.voxel_size = settings.remesh_voxel_size
+        remesh.adaptivity = 0.0
+        remesh.use_smooth_shade = True
+
+    # Optimization / Decimation
+    if settings.use_optimization:
+        decimate = obj.modifiers.new("Optimize", "DECIMATE")
+        decimate.decimate_type = 'COLLAPSE'
+        decimate.ratio = settings.optimization_ratio
+        # If using Voxel Remesh, usually Triangulate is handled by it, but Decimate works on Tris.
+        # No special extra settings needed for basic reduction.
+
+    # Volume / Solidity
+    if settings.use_solidify:
+        solid = obj.modifiers.new("Solidify", "SOLIDIFY")
+        solid.thickness = settings.thickness_amount
+        solid.offset = 0 # Center the solidify? Or -1. User usually expects inward/outward. Default -1.
+        # To prevent "collapsing edges" (z-fighting/self intersection), we might want Even Thickness
+        solid.use_even_offset = True
+
+class DEPTHMESH_PG_settings(PropertyGroup):
+    """Generation parameters stored on a depth mesh object, editable after creation."""
+
+    is_depth_mesh: BoolProperty(
+        name="Is Depth Mesh",
+        description="Object was created by the depth mesh generator",
+        default=False
+    )
+
+    # Depth Controls
+    depth_strength: FloatProperty(
+        name="Strength",
+        description="Displacement strength",
+        default=0.5,
+        min=-10.0,
+        max=10.0,
+        update=_update_displace
+    )
+
+    depth_midlevel: FloatProperty(
+        name="Midlevel",
+        description="Texture value treated as no displacement",
+        default=0.5,
+        min=0.0,
+        max=1.0,
+        update=_update_displace
+    )
+
+    invert_depth: BoolProperty(
+        name="Invert Depth",
+        description="Invert the depth map (dark becomes high)",
+        default=False,
+        update=_update_displace
+    )
+
+    use_clamp: BoolProperty(
+        name="Clamp",
+        description="Clamp texture values to 0-1 range (Clip Extension)",
+        default=True,
+        update=_update_clamp
+    )
+
+    # Geometry Refinement
+    refinement_method: EnumProperty(
+        name="Refinement",
+        description="Method to refine geometry after displacement",
+        items=[
+            ('SUBDIV', "Subdivision Only", "Standard subdivision (Fast)"),
+            ('REMESH', "Voxel Remesh", "Rebuilds mesh with uniform voxels (Good for sculpting, destroys UVs)"),
+        ],
+        default='SUBDIV',
+        update=_update_stack
+    )
+
+    use_optimization: BoolProperty(
+        name="Optimize Mesh",
+        description="Reduce polygon count while preserving shape (Decimate)",
+        default=False,
+        update=_update_stack
+    )
+
+    optimization_ratio: FloatProperty(
+        name="Optimization Ratio",
+        description="Ratio of triangles to reduce to (0.1 = 10% of original count)",
+        default=0.5,
+        min=0.01,
+        max=1.0,
+        precision=2,
+        update=_update_optimize
+    )
+
+    remesh_voxel_size: FloatProperty(
+        name="Voxel Size",
+        description="Size of voxels for remeshing (Smaller = More Detail)",
+        default=0.05,
+        min=0.001,
+        max=1.0,
+        precision=3,
+        update=_update_remesh
+    )
+
+    # Volume / Solidity
+    use_solidify: BoolProperty(
+        name="Add Thickness",
+        description="Add a solid volume to the mesh",
+        default=False,
+        update=_update_stack
+    )
+
+    thickness_amount: FloatProperty(
+        name="Thickness",
+        description="Amount of thickness to add",
+        default=0.1,
+        min=0.0,
+        max=10.0,
+        update=_update_solidify
+    )
@@ -33,3 +33,24 @@ class DEPTHMESH_PT_panel(Panel):
         layout.separator()
         layout.label(text="Manual Generation")
         layout.operator("object.generate_depth_mesh")
+
+        # Live settings of the active depth mesh, updated in place
+        obj = context.active_object
+        if obj and obj.depth_mesh.is_depth_mesh:
+            settings = obj.depth_mesh
+            layout.separator()
+            layout.label(text=f"Edit: {obj.name}")
+            box = layout.box()
+            box.prop(settings, "depth_strength")
+            box.prop(settings, "depth_midlevel")
+            box.prop(settings, "invert_depth")
+            box.prop(settings, "use_clamp")
+            box.prop(settings, "refinement_method")
+            if settings.refinement_method == 'REMESH':
+                box.prop(settings, "remesh_voxel_size")
+            box.prop(settings, "use_optimization")
+            if settings.use_optimization:
+                box.prop(settings, "optimization_ratio")
+            box.prop(settings, "use_solidify")
+            if settings.use_solidify:
+                box.prop(settings, "thickness_amount")